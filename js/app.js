@@ -287,11 +287,25 @@ function setupControls() {
     });
 
     // Visual sliders
+    // A drag fires 'input' far faster than the globe can redraw, and each redraw rebuilds
+    // every trace. Coalesce to at most one rebuild per animation frame using the latest
+    // slider values; labels still update on every tick. Only depth moves any geometry —
+    // size/mag changes are patched in place by updateQuakeSizes.
+    let _sliderFrame = null;
+    let _sliderDepthChanged = false;
     ['size-slider', 'mag-slider', 'depth-slider'].forEach(id => {
         document.getElementById(id).addEventListener('input', () => {
             updateLabels();
-            if (tlState.active) updateTimeLapseFrame();
-            else updatePlot();
+            if (id === 'depth-slider') _sliderDepthChanged = true;
+            if (_sliderFrame) return;
+            _sliderFrame = requestAnimationFrame(() => {
+                _sliderFrame = null;
+                const depthChanged = _sliderDepthChanged;
+                _sliderDepthChanged = false;
+                if (tlState.active) updateTimeLapseFrame();
+                else if (depthChanged) updatePlot();
+                else updateQuakeSizes();
+            });
         });
     });
 
@@ -302,8 +316,15 @@ function setupControls() {
 
     document.getElementById('render-scale').addEventListener('input', updateLabels);
 
-    // Checkboxes
-    ['labels-checkbox', 'borders-checkbox', 'plates-checkbox', 'volcanoes-checkbox', 'surface-lines-checkbox'].forEach(id => {
+    // Checkboxes — borders/plates/labels only restyle their own traces; volcanoes and
+    // surface lines build trace data, so they still need a full updatePlot.
+    ['labels-checkbox', 'borders-checkbox', 'plates-checkbox'].forEach(id => {
+        document.getElementById(id).addEventListener('change', () => {
+            if (tlState.active) updateStaticTracesForTimelapse();
+            else updateStaticOverlays();
+        });
+    });
+    ['volcanoes-checkbox', 'surface-lines-checkbox'].forEach(id => {
         document.getElementById(id).addEventListener('change', () => {
             if (tlState.active) updateStaticTracesForTimelapse();
             else updatePlot();
@@ -670,6 +691,15 @@ function setupInteraction() {
 }
 
 // --- Main App Logic ---
+
+// The border, plate and volcano datasets are effectively static, but raw.githubusercontent
+// only marks them fresh for 5 minutes. force-cache reuses any stored copy without
+// revalidating. It would also reuse a stored error response (which gets the same max-age),
+// so anything not OK is refetched from the network, which replaces that cache entry.
+async function _fetchStaticDataset(url) {
+    const res = await fetch(url, { cache: 'force-cache' });
+    return res.ok ? res : fetch(url, { cache: 'reload' });
+}
 async function initApp() {
     try {
         console.log("Starting application...");
@@ -678,10 +708,16 @@ async function initApp() {
         console.log("Downloading static map data...");
         document.getElementById('loading').innerText = "Loading Map Data...";
 
+        // Start the USGS query now rather than after the map data is processed — it only
+        // needs the filter controls, which setDefaults has already populated. The no-op
+        // catch stops a failure being reported as unhandled before fetchDataAndPlot awaits it.
+        const quakeRequest = fetchQuakeJson();
+        quakeRequest.catch(() => {});
+
         const [borderRes, platesRes, volcanoRes, notableRes] = await Promise.all([
-            fetch(BORDERS_URL),
-            fetch(PLATES_URL),
-            fetch(VOLCANOES_URL),
+            _fetchStaticDataset(BORDERS_URL),
+            _fetchStaticDataset(PLATES_URL),
+            _fetchStaticDataset(VOLCANOES_URL),
             fetch(NOTABLE_URL).catch(() => null)
         ]);
 
@@ -705,7 +741,7 @@ async function initApp() {
 
         setupControls();
 
-        await fetchDataAndPlot(true);
+        await fetchDataAndPlot(true, quakeRequest);
 
         setupInteraction();
         requestAnimationFrame(animateGlobe);
@@ -23,6 +23,16 @@ function getColorRange(colorMode) {
     return { cmin: stats.minTime, cmax: stats.maxTime, title: 'Date' };
 }
 
+// Line widths / label size for the border, plate and label overlays from their checkboxes.
+// 0 means the overlay is switched off.
+function getOverlaySizes() {
+    return {
+        borderWidth: document.getElementById('borders-checkbox').checked ? BASE_BORDER_WIDTH : 0,
+        plateWidth:  document.getElementById('plates-checkbox').checked  ? BASE_PLATE_WIDTH  : 0,
+        labelSize:   document.getElementById('labels-checkbox').checked  ? 12 : 0
+    };
+}
+
 // --- Helper to calculate size array for renderer ---
 function calculateScaledSizes(multiplier) {
     const baseSize = parseFloat(document.getElementById('size-slider').value);
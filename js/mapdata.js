@@ -1,77 +1,83 @@
 function latLonToXYZ(lat, lon, radius) {
-    const latRad = lat * Math.PI / 180;
-    const lonRad = lon * Math.PI / 180;
-    const x = radius * Math.cos(latRad) * Math.cos(lonRad);
-    const y = radius * Math.cos(latRad) * Math.sin(lonRad);
+    const latRad = lat * DEG2RAD;
+    const lonRad = lon * DEG2RAD;
+    const rCosLat = radius * Math.cos(latRad);
+    const x = rCosLat * Math.cos(lonRad);
+    const y = rCosLat * Math.sin(lonRad);
     const z = radius * Math.sin(latRad);
     return [x, y, z];
 }
 
-function processBorders(geojson) {
-    const bx = [], by = [], bz = [];
-    const lx = [], ly = [], lz = [], lt = [];
+// Same transform as latLonToXYZ, but appends straight onto three coordinate arrays so the
+// per-vertex [x, y, z] temporary is never allocated. Used for the large border/plate sets.
+function pushLatLonXYZ(xs, ys, zs, lat, lon, radius) {
+    const latRad = lat * DEG2RAD;
+    const lonRad = lon * DEG2RAD;
+    const rCosLat = radius * Math.cos(latRad);
+    xs.push(rCosLat * Math.cos(lonRad));
+    ys.push(rCosLat * Math.sin(lonRad));
+    zs.push(radius * Math.sin(latRad));
+}
 
-    geojson.features.forEach(feature => {
-        const geometry = feature.geometry;
-        if (!geometry) return;
+// Appends one outer ring to the border arrays (null-terminated) and returns the
+// centre and area of its bounding box, or null if the ring is empty. Declared once at module
+// level and walked with a plain loop, so the ~thousands of rings cost no closure or callback.
+function _processBorderRing(ring, bx, by, bz) {
+    const n = ring.length;
+    if (n === 0) {
+        bx.push(null); by.push(null); bz.push(null);
+        return null;
+    }
 
-        const name = feature.properties ? feature.properties.name : null;
-        const type = geometry.type;
+    let rMinLat = 90, rMaxLat = -90, rMinLon = 180, rMaxLon = -180;
 
-        const candidates = [];
+    for (let i = 0; i < n; i++) {
+        const lon = ring[i][0];
+        const lat = ring[i][1];
 
-        const processRing = (ring) => {
-            let rMinLat = 90, rMaxLat = -90, rMinLon = 180, rMaxLon = -180;
-            let count = 0;
+        pushLatLonXYZ(bx, by, bz, lat, lon, EARTH_RADIUS);
 
-            ring.forEach(pt => {
-                const lon = pt[0];
-                const lat = pt[1];
+        if (lat < rMinLat) rMinLat = lat;
+        if (lat > rMaxLat) rMaxLat = lat;
+        if (lon < rMinLon) rMinLon = lon;
+        if (lon > rMaxLon) rMaxLon = lon;
+    }
+    bx.push(null); by.push(null); bz.push(null);
 
-                const [x, y, z] = latLonToXYZ(lat, lon, EARTH_RADIUS);
-                bx.push(x); by.push(y); bz.push(z);
+    return {
+        lat: (rMinLat + rMaxLat) / 2,
+        lon: (rMinLon + rMaxLon) / 2,
+        area: (rMaxLat - rMinLat) * (rMaxLon - rMinLon)
+    };
+}
 
-                if (lat < rMinLat) rMinLat = lat;
-                if (lat > rMaxLat) rMaxLat = lat;
-                if (lon < rMinLon) rMinLon = lon;
-                if (lon > rMaxLon) rMaxLon = lon;
-                count++;
-            });
-            bx.push(null); by.push(null); bz.push(null);
+function processBorders(geojson) {
+    const bx = [], by = [], bz = [];
+    const lx = [], ly = [], lz = [], lt = [];
 
-            if (count === 0) return null;
+    for (const feature of geojson.features) {
+        const geometry = feature.geometry;
+        if (!geometry) continue;
 
-            const latSpan = rMaxLat - rMinLat;
-            const lonSpan = rMaxLon - rMinLon;
-            const area = latSpan * lonSpan;
+        const name = feature.properties ? feature.properties.name : null;
+        const type = geometry.type;
 
-            return {
-                lat: (rMinLat + rMaxLat) / 2,
-                lon: (rMinLon + rMaxLon) / 2,
-                area: area
-            };
-        };
-
-        if (type === 'Polygon') {
-            const ring = geometry.coordinates[0];
-            const data = processRing(ring);
-            if (data) candidates.push(data);
-        } else if (type === 'MultiPolygon') {
-            geometry.coordinates.forEach(poly => {
-                const ring = poly[0];
-                const data = processRing(ring);
-                if (data) candidates.push(data);
-            });
+        // Only outer rings are drawn. Track the largest as we go for the label position.
+        let largest = null;
+        const polys = type === 'Polygon' ? [geometry.coordinates]
+                    : type === 'MultiPolygon' ? geometry.coordinates
+                    : [];
+        for (const poly of polys) {
+            const data = _processBorderRing(poly[0], bx, by, bz);
+            if (data && (!largest || data.area > largest.area)) largest = data;
         }
 
-        if (name && candidates.length > 0) {
-            candidates.sort((a, b) => b.area - a.area);
-            const largest = candidates[0];
+        if (name && largest) {
             const [cx, cy, cz] = latLonToXYZ(largest.lat, largest.lon, EARTH_RADIUS * 1.01);
             lx.push(cx); ly.push(cy); lz.push(cz);
             lt.push(name);
         }
-    });
+    }
 
     return {
         borders: { x: bx, y: by, z: bz },
@@ -94,8 +100,7 @@ function processPlates(geojson) {
 
         lines.forEach(line => {
             line.forEach(pt => {
-                const [x, y, z] = latLonToXYZ(pt[1], pt[0], EARTH_RADIUS + 2);
-                px.push(x); py.push(y); pz.push(z);
+                pushLatLonXYZ(px, py, pz, pt[1], pt[0], EARTH_RADIUS + 2);
             });
             px.push(null); py.push(null); pz.push(null);
         });
@@ -133,7 +138,10 @@ function processVolcanoes(csvText) {
 
         if (isNaN(lat) || isNaN(lon)) continue;
 
-        data.push({ name, lat, lon, elev, type, status });
+        // Unit-sphere direction, so redraws only scale by the elevation-adjusted radius.
+        const [ux, uy, uz] = latLonToXYZ(lat, lon, 1);
+
+        data.push({ name, lat, lon, ux, uy, uz, elev, type, status });
     }
     return data;
 }
@@ -156,19 +164,33 @@ function processNotable(geojson) {
 }
 
 function generateWireframeGrid() {
+    const STEP = 5; // every grid vertex sits on a 5° lattice
     const gx = [], gy = [], gz = [];
-    for (let lat = -90; lat <= 90; lat += 15) {
-        for (let lon = -180; lon <= 180; lon += 5) {
-            const [x, y, z] = latLonToXYZ(lat, lon, EARTH_RADIUS);
-            gx.push(x); gy.push(y); gz.push(z);
-        }
+
+    // Trig tables for the lattice, indexed by (deg + 90) / STEP and (deg + 180) / STEP.
+    // Each vertex is then an outer product of one lat and one lon entry — no trig per point.
+    const cosLat = [], sinLat = [], cosLon = [], sinLon = [];
+    for (let lat = -90; lat <= 90; lat += STEP) {
+        cosLat.push(Math.cos(lat * DEG2RAD)); sinLat.push(Math.sin(lat * DEG2RAD));
+    }
+    for (let lon = -180; lon <= 180; lon += STEP) {
+        cosLon.push(Math.cos(lon * DEG2RAD)); sinLon.push(Math.sin(lon * DEG2RAD));
+    }
+    const pushVertex = (lat, lon) => {
+        const a = (lat + 90) / STEP, b = (lon + 180) / STEP;
+        const rc = EARTH_RADIUS * cosLat[a];
+        gx.push(rc * cosLon[b]); gy.push(rc * sinLon[b]); gz.push(EARTH_RADIUS * sinLat[a]);
+    };
+
+    // Parallels skip ±90°: at the poles every vertex collapses onto the same point, so those
+    // two lines are 146 invisible vertices. The meridians still run pole to pole.
+    // Strides are written as multiples of STEP so every vertex stays on the table lattice.
+    for (let lat = -90 + 3 * STEP; lat <= 90 - 3 * STEP; lat += 3 * STEP) {
+        for (let lon = -180; lon <= 180; lon += STEP) pushVertex(lat, lon);
         gx.push(null); gy.push(null); gz.push(null);
     }
-    for (let lon = -180; lon <= 180; lon += 30) {
-        for (let lat = -90; lat <= 90; lat += 5) {
-            const [x, y, z] = latLonToXYZ(lat, lon, EARTH_RADIUS);
-            gx.push(x); gy.push(y); gz.push(z);
-        }
+    for (let lon = -180; lon <= 180; lon += 6 * STEP) {
+        for (let lat = -90; lat <= 90; lat += STEP) pushVertex(lat, lon);
         gx.push(null); gy.push(null); gz.push(null);
     }
     return { x: gx, y: gy, z: gz };
@@ -1,31 +1,38 @@
-async function fetchDataAndPlot(isInitial = false) {
+// Builds the USGS query from the current filter controls and returns the parsed GeoJSON.
+async function fetchQuakeJson() {
+    const start = document.getElementById('start-date').value;
+    const end = document.getElementById('end-date').value;
+    const minMag = document.getElementById('min-mag-slider').value;
+    const maxMag = document.getElementById('max-mag-slider').value;
+    const minDepth = document.getElementById('min-depth-filter').value;
+    const maxDepth = document.getElementById('max-depth-filter').value;
+    const limit = document.getElementById('limit-select').value;
+
+    let url = `${USGS_BASE_URL}&starttime=${start}`;
+    if (end) url += `&endtime=${end}`;
+
+    if(parseFloat(minMag) > 0) url += `&minmagnitude=${minMag}`;
+    if(parseFloat(maxMag) < 10) url += `&maxmagnitude=${maxMag}`;
+    url += `&mindepth=${minDepth}&maxdepth=${maxDepth}`;
+    url += `&limit=${limit}`;
+
+    console.log("Fetching: " + url);
+
+    const res = await fetch(url);
+    if (!res.ok) throw new Error("API Limit or Network Error");
+    return res.json();
+}
+
+// quakeRequest lets initApp pass in a query it already started in parallel with the
+// static map downloads; otherwise a fresh one is issued from the current controls.
+async function fetchDataAndPlot(isInitial = false, quakeRequest = null) {
     if (!isInitial) { if (tlState.active) stopTimeLapse(); stopLive(); }
     const loading = document.getElementById('loading');
     loading.style.display = 'block';
     loading.innerText = "Querying USGS...";
 
     try {
-        const start = document.getElementById('start-date').value;
-        const end = document.getElementById('end-date').value;
-        const minMag = document.getElementById('min-mag-slider').value;
-        const maxMag = document.getElementById('max-mag-slider').value;
-        const minDepth = document.getElementById('min-depth-filter').value;
-        const maxDepth = document.getElementById('max-depth-filter').value;
-        const limit = document.getElementById('limit-select').value;
-
-        let url = `${USGS_BASE_URL}&starttime=${start}`;
-        if (end) url += `&endtime=${end}`;
-
-        if(parseFloat(minMag) > 0) url += `&minmagnitude=${minMag}`;
-        if(parseFloat(maxMag) < 10) url += `&maxmagnitude=${maxMag}`;
-        url += `&mindepth=${minDepth}&maxdepth=${maxDepth}`;
-        url += `&limit=${limit}`;
-
-        console.log("Fetching: " + url);
-
-        const res = await fetch(url);
-        if (!res.ok) throw new Error("API Limit or Network Error");
-        const quakeJson = await res.json();
+        const quakeJson = await (quakeRequest || fetchQuakeJson());
 
         stats = { maxMag: 0, maxDepth: 0, minTime: Infinity, maxTime: -Infinity, avgMag: 0, minMag: Infinity, minDepth: Infinity };
         let totalMag = 0, count = 0, totalRealMag = 0, totalDepth = 0;
@@ -34,11 +41,14 @@ async function fetchDataAndPlot(isInitial = false) {
         let magCounts = { "0-3": 0, "3-5": 0, "5-7": 0, "7+": 0 };
         let depthCounts = { "Shallow (<70km)": 0, "Intermediate (70-300km)": 0, "Deep (>300km)": 0 };
 
+        // Single pass over the features: each one's properties/coordinates are looked up
+        // once and feed both the stats and the quake record.
         rawQuakeData = quakeJson.features.map(f => {
-            const realMag = f.properties.mag || 0;
+            const p = f.properties;
+            const [lon, lat, depth] = f.geometry.coordinates;
+            const realMag = p.mag || 0;
             const visualMag = Math.max(realMag, 0.1);
-            const depth = f.geometry.coordinates[2];
-            const time = f.properties.time;
+            const time = p.time;
 
             if (realMag < stats.minMag) stats.minMag = realMag;
             if (realMag > stats.maxMag) stats.maxMag = realMag;
@@ -62,15 +72,31 @@ async function fetchDataAndPlot(isInitial = false) {
             else if (depth < 300) depthCounts["Intermediate (70-300km)"]++;
             else depthCounts["Deep (>300km)"]++;
 
+            // Unit-sphere direction, cached so depth-slider redraws are a multiply, not trig.
+            const [ux, uy, uz] = latLonToXYZ(lat, lon, 1);
+            const place = p.place || "Unknown";
+
+            // Hover text never depends on the sliders, so build it once here rather than
+            // reformatting every quake's date string on each redraw.
+            const d = new Date(time);
+            const dateStr = `${d.getFullYear()}-${String(d.getMonth()+1).padStart(2, '0')}-${String(d.getDate()).padStart(2, '0')} ${String(d.getHours()).padStart(2, '0')}:${String(d.getMinutes()).padStart(2, '0')}`;
+            const hoverText =
+                `<b>${place}</b><br>` +
+                `Date: ${dateStr}<br>` +
+                `Magnitude: ${realMag.toFixed(2)}<br>` +
+                `Depth: ${depth.toFixed(2)}km`;
+
             return {
-                lat: f.geometry.coordinates[1],
-                lon: f.geometry.coordinates[0],
+                lat: lat,
+                lon: lon,
+                ux: ux, uy: uy, uz: uz,
                 depth: depth,
                 mag: visualMag,
                 realMag: realMag,
                 time: time,
-                place: f.properties.place || "Unknown",
-                url: f.properties.url,
+                place: place,
+                hoverText: hoverText,
+                url: p.url,
                 type: 'quake'
             };
         });
@@ -118,12 +144,9 @@ async function updatePlot(isInitial = false) {
     const baseSize = parseFloat(document.getElementById('size-slider').value);
 
     // Checkbox logic replacing slider logic
-    const bordersEnabled = document.getElementById('borders-checkbox').checked;
-    const platesEnabled = document.getElementById('plates-checkbox').checked;
+    const { borderWidth, plateWidth, labelSize } = getOverlaySizes();
     const volcanoesEnabled = document.getElementById('volcanoes-checkbox').checked;
-    const showLabels = document.getElementById('labels-checkbox').checked;
     const showSurfaceLines = document.getElementById('surface-lines-checkbox').checked;
-    const labelSize = showLabels ? 12 : 0;
 
     // Light Mode check
     // Use dark grey for borders in light mode for better contrast
@@ -142,15 +165,14 @@ async function updatePlot(isInitial = false) {
     const volcColor = isLightMode ? 'white' : 'black';
     const volcLine = isLightMode ? 'black' : 'white';
 
-    // Modified: Constant thick widths for both modes (2px borders, 3px plates)
-    // UPDATED: Now using global constants
-    const borderWidth = bordersEnabled ? BASE_BORDER_WIDTH : 0;
-    const plateWidth = platesEnabled ? BASE_PLATE_WIDTH : 0;
-
     const selectedPalette = document.getElementById('color-select').value;
     const colorMode = document.getElementById('color-mode').value;
 
-    const qx = [], qy = [], qz = [], ghostSizes = [], colors = [], texts = [];
+    // Quake positions never contain null breaks, so they can live in preallocated
+    // single-precision buffers — half the memory of JS doubles, and what WebGL consumes anyway.
+    const nQuakes = rawQuakeData.length;
+    const qx = new Float32Array(nQuakes), qy = new Float32Array(nQuakes), qz = new Float32Array(nQuakes);
+    const ghostSizes = [], colors = [], texts = [];
     const customData = []; // To store full object references for click events
     // Arrays for surface lines
     const slx = [], sly = [], slz = [];
@@ -164,8 +186,8 @@ async function updatePlot(isInitial = false) {
 
     rawQuakeData.forEach((q, i) => {
         const r_quake = EARTH_RADIUS - (q.depth * depthScale);
-        const [x, y, z] = latLonToXYZ(q.lat, q.lon, r_quake);
-        qx.push(x); qy.push(y); qz.push(z);
+        const x = q.ux * r_quake, y = q.uy * r_quake, z = q.uz * r_quake;
+        qx[i] = x; qy[i] = y; qz[i] = z;
 
         const s = sizes[i]; // Use pre-calculated size
         ghostSizes.push(Math.max(s * 2, 10));
@@ -180,18 +202,11 @@ async function updatePlot(isInitial = false) {
 
         colors.push(val);
 
-        const d = new Date(q.time);
-        const dateStr = `${d.getFullYear()}-${String(d.getMonth()+1).padStart(2, '0')}-${String(d.getDate()).padStart(2, '0')} ${String(d.getHours()).padStart(2, '0')}:${String(d.getMinutes()).padStart(2, '0')}`;
-        texts.push(
-            `<b>${q.place}</b><br>` +
-            `Date: ${dateStr}<br>` +
-            `Magnitude: ${q.realMag.toFixed(2)}<br>` +
-            `Depth: ${q.depth.toFixed(2)}km`
-        );
+        texts.push(q.hoverText);
 
         // Build Surface Lines (Earthquakes)
         if (showSurfaceLines) {
-              const [sx, sy, sz] = latLonToXYZ(q.lat, q.lon, EARTH_RADIUS);
+              const sx = q.ux * EARTH_RADIUS, sy = q.uy * EARTH_RADIUS, sz = q.uz * EARTH_RADIUS;
               // Line from Surface (sx, sy, sz) to Quake (x, y, z)
               slx.push(sx); sly.push(sy); slz.push(sz);
               slx.push(x);  sly.push(y);  slz.push(z);
@@ -245,7 +260,7 @@ async function updatePlot(isInitial = false) {
             // Position Logic: Earth Radius + (Elev_km * depthScale)
             // Convert meters to km first
             const r_volc = EARTH_RADIUS + ((v.elev / 1000) * depthScale);
-            const [x, y, z] = latLonToXYZ(v.lat, v.lon, r_volc);
+            const x = v.ux * r_volc, y = v.uy * r_volc, z = v.uz * r_volc;
 
             if (volcanoesEnabled) {
                 vx.push(x); vy.push(y); vz.push(z);
@@ -268,7 +283,7 @@ async function updatePlot(isInitial = false) {
             // Volcano Surface Lines Logic
             if (showSurfaceLines && volcanoesEnabled) {
                 // Surface point
-                const [sx, sy, sz] = latLonToXYZ(v.lat, v.lon, EARTH_RADIUS);
+                const sx = v.ux * EARTH_RADIUS, sy = v.uy * EARTH_RADIUS, sz = v.uz * EARTH_RADIUS;
 
                 vlx.push(sx); vly.push(sy); vlz.push(sz);
                 vlx.push(x);  vly.push(y);  vlz.push(z);
@@ -430,14 +445,39 @@ async function updatePlot(isInitial = false) {
     }
 }
 
+// The size and magnitude-bonus sliders only affect marker sizes, so patch those in place
+// with a single Plotly.restyle instead of re-sending every trace through Plotly.react.
+async function updateQuakeSizes() {
+    const baseSize = parseFloat(document.getElementById('size-slider').value);
+    const sizes = calculateScaledSizes(1.0);
+    const ghostSizes = sizes.map(s => Math.max(s * 2, 10));
+
+    syncSceneCamera();
+    await Plotly.restyle('chart-container', {
+        'marker.size': [sizes, ghostSizes, baseSize]
+    }, [TRACE.QUAKE, TRACE.GHOST, TRACE.VOLCANO]);
+}
+
+// The border/plate/label checkboxes only toggle static traces, so restyle those alone rather
+// than rebuilding the quake, volcano and surface-line data through Plotly.react.
+async function updateStaticOverlays() {
+    const { borderWidth, plateWidth, labelSize } = getOverlaySizes();
+
+    // One restyle so a toggle costs a single redraw. Per-trace arrays use undefined to
+    // leave an attribute untouched on traces it doesn't apply to.
+    syncSceneCamera();
+    await Plotly.restyle('chart-container', {
+        visible:         [borderWidth > 0, plateWidth > 0, labelSize > 0],
+        'line.width':    [borderWidth, plateWidth, undefined],
+        'textfont.size': [undefined, undefined, labelSize]
+    }, [TRACE.BORDER, TRACE.PLATE, TRACE.LABEL]);
+}
+
 // During timelapse, update only the static/visual traces via Plotly.restyle so the
 // layout (and therefore the camera) is never touched.
 function updateStaticTracesForTimelapse() {
     const depthScale       = parseFloat(document.getElementById('depth-slider').value);
-    const bordersEnabled   = document.getElementById('borders-checkbox').checked;
-    const platesEnabled    = document.getElementById('plates-checkbox').checked;
     const volcanoesEnabled = document.getElementById('volcanoes-checkbox').checked;
-    const showLabels       = document.getElementById('labels-checkbox').checked;
     const showSurfaceLines = document.getElementById('surface-lines-checkbox').checked;
     const selectedPalette  = document.getElementById('color-select').value;
     const colorMode        = document.getElementById('color-mode').value;
@@ -452,17 +492,15 @@ function updateStaticTracesForTimelapse() {
     const coreOpacity      = isLightMode ? 0.4                       : 0.2;
     const volcanoLineColor = isLightMode ? 'rgba(0,0,0,0.4)'        : 'rgba(255,255,255,0.4)';
     const bgColor          = isLightMode ? '#f0f0f0'                 : 'black';
-    const borderWidth      = bordersEnabled ? BASE_BORDER_WIDTH : 0;
-    const plateWidth       = platesEnabled  ? BASE_PLATE_WIDTH  : 0;
-    const labelSize        = showLabels     ? 12                : 0;
+    const { borderWidth, plateWidth, labelSize } = getOverlaySizes();
 
     syncSceneCamera();
 
     Plotly.relayout('chart-container', { paper_bgcolor: bgColor, plot_bgcolor: bgColor });
     Plotly.restyle('chart-container', { 'line.color': gridColor                                                              }, [TRACE.GRID]);
     Plotly.restyle('chart-container', { 'marker.color': coreColor, 'marker.opacity': coreOpacity                            }, [TRACE.CORE]);
-    Plotly.restyle('chart-container', { visible: bordersEnabled, 'line.color': borderColor, 'line.width': borderWidth       }, [TRACE.BORDER]);
-    Plotly.restyle('chart-container', { visible: platesEnabled,  'line.color': plateColor,  'line.width': plateWidth        }, [TRACE.PLATE]);
+    Plotly.restyle('chart-container', { visible: borderWidth > 0, 'line.color': borderColor, 'line.width': borderWidth       }, [TRACE.BORDER]);
+    Plotly.restyle('chart-container', { visible: plateWidth > 0,  'line.color': plateColor,  'line.width': plateWidth        }, [TRACE.PLATE]);
     Plotly.restyle('chart-container', { visible: labelSize > 0,  'textfont.size': labelSize, 'textfont.color': labelColor   }, [TRACE.LABEL]);
 
     if (volcanoesEnabled) {
@@ -470,12 +508,12 @@ function updateStaticTracesForTimelapse() {
         const vlx = [], vly = [], vlz = [];
         rawVolcanoData.forEach(v => {
             const r = EARTH_RADIUS + ((v.elev / 1000) * depthScale);
-            const [x, y, z] = latLonToXYZ(v.lat, v.lon, r);
+            const x = v.ux * r, y = v.uy * r, z = v.uz * r;
             vx.push(x); vy.push(y); vz.push(z);
             vtext.push(`<b>${v.name}</b><br>Type: ${v.type}<br>Elevation: ${v.elev}m`);
             vCustom.push({ type: 'volcano', name: v.name, lat: v.lat, lon: v.lon, elev: v.elev, volcType: v.type, status: v.status });
             if (showSurfaceLines) {
-                const [sx, sy, sz] = latLonToXYZ(v.lat, v.lon, EARTH_RADIUS);
+                const sx = v.ux * EARTH_RADIUS, sy = v.uy * EARTH_RADIUS, sz = v.uz * EARTH_RADIUS;
                 vlx.push(sx, x, null); vly.push(sy, y, null); vlz.push(sz, z, null);
             }
         });
@@ -498,8 +536,8 @@ function updateStaticTracesForTimelapse() {
         }
         windowQuakes.forEach(q => {
             const r = EARTH_RADIUS - (q.depth * depthScale);
-            const [x, y, z] = latLonToXYZ(q.lat, q.lon, r);
-            const [sx, sy, sz] = latLonToXYZ(q.lat, q.lon, EARTH_RADIUS);
+            const x = q.ux * r, y = q.uy * r, z = q.uz * r;
+            const sx = q.ux * EARTH_RADIUS, sy = q.uy * EARTH_RADIUS, sz = q.uz * EARTH_RADIUS;
             const val = colorMode === 'depth' ? q.depth : colorMode === 'mag' ? q.mag : q.time;
             slx.push(sx, x, null); sly.push(sy, y, null); slz.push(sz, z, null);
             lineColors.push(val, val, val);
@@ -1,5 +1,6 @@
 // --- Constants ---
 const EARTH_RADIUS = 6371;
+const DEG2RAD = Math.PI / 180;
 const USGS_BASE_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query?format=geojson&orderby=magnitude";
 const NOTABLE_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query?format=geojson&orderby=magnitude&minmagnitude=7.5&minsig=800&limit=100&starttime=1900-01-01";
 const BORDERS_URL = "https://raw.githubusercontent.com/johan/world.geo.json/master/countries.geo.json";
@@ -61,18 +61,25 @@ async function updateTimeLapseFrame() {
         visibleQuakes = visibleQuakes.concat(tlState.sortedData.filter(q => q.time >= wrapCutoff));
     }
 
-    const qx = [], qy = [], qz = [], colors = [], sizes = [];
-
-    // Dummy point keeps the colorbar visible when there are no quakes in the window.
-    if (visibleQuakes.length === 0) {
-        qx.push(null); qy.push(null); qz.push(null);
-        colors.push(stats.minTime);
-        sizes.push(0);
+    // This runs every timelapse tick, so write straight into preallocated typed buffers
+    // rather than growing plain arrays. Colours stay Float64 — epoch-ms times need the precision.
+    const n = visibleQuakes.length;
+    let qx, qy, qz, colors, sizes;
+
+    if (n === 0) {
+        // Dummy point keeps the colorbar visible when there are no quakes in the window.
+        qx = [null]; qy = [null]; qz = [null];
+        colors = [stats.minTime];
+        sizes = [0];
+    } else {
+        qx = new Float32Array(n); qy = new Float32Array(n); qz = new Float32Array(n);
+        sizes = new Float32Array(n);
+        colors = new Float64Array(n);
     }
 
-    visibleQuakes.forEach(q => {
-        const [x, y, z] = latLonToXYZ(q.lat, q.lon, EARTH_RADIUS - q.depth * depthScale);
-        qx.push(x); qy.push(y); qz.push(z);
+    visibleQuakes.forEach((q, i) => {
+        const r = EARTH_RADIUS - q.depth * depthScale;
+        qx[i] = q.ux * r; qy[i] = q.uy * r; qz[i] = q.uz * r;
 
         // freshness: 1.0 = just happened, 0.0 = about to expire
         let timeDiff = windowEnd - q.time;
@@ -81,9 +88,9 @@ async function updateTimeLapseFrame() {
 
         let s = quakeBaseSize(q, baseSize, magBonusScale);
         s *= (tlState.popEnabled && freshness > 0.95) ? 2.0 : (0.5 + 0.5 * freshness);
-        sizes.push(s);
+        sizes[i] = s;
 
-        colors.push(colorMode === 'depth' ? q.depth : colorMode === 'mag' ? q.mag : q.time);
+        colors[i] = colorMode === 'depth' ? q.depth : colorMode === 'mag' ? q.mag : q.time;
     });
 
     const { cmin, cmax } = getColorRange(colorMode);
@@ -119,8 +126,9 @@ async function updateTimeLapseFrame() {
     if (document.getElementById('surface-lines-checkbox').checked) {
         const slx = [], sly = [], slz = [], slColors = [];
         visibleQuakes.forEach(q => {
-            const [x, y, z] = latLonToXYZ(q.lat, q.lon, EARTH_RADIUS - q.depth * depthScale);
-            const [sx, sy, sz] = latLonToXYZ(q.lat, q.lon, EARTH_RADIUS);
+            const r = EARTH_RADIUS - q.depth * depthScale;
+            const x = q.ux * r, y = q.uy * r, z = q.uz * r;
+            const sx = q.ux * EARTH_RADIUS, sy = q.uy * EARTH_RADIUS, sz = q.uz * EARTH_RADIUS;
             const val = colorMode === 'depth' ? q.depth : colorMode === 'mag' ? q.mag : q.time;
             slx.push(sx, x, null); sly.push(sy, y, null); slz.push(sz, z, null);
             slColors.push(val, val, val);